@@ -8,10 +8,11 @@ from typing import Any
 import pandas as pd
 
 
-def _read_optional_csv(path: Path) -> pd.DataFrame | None:
+def _read_summary_row(path: Path) -> pd.Series | None:
     if not path.exists():
         return None
-    return pd.read_csv(path)
+    frame = pd.read_csv(path, nrows=1)
+    return None if frame.empty else frame.iloc[0]
 
 
 def _bool_label(value: object) -> str:
@@ -32,13 +33,13 @@ def write_checkin_summary(
     student_housing_diagnostics: dict[str, Any],
 ) -> Path:
     """Persist a markdown summary that explains the current project state."""
-    model_results = pd.read_csv(model_results_path).iloc[0]
+    model_results = pd.read_csv(model_results_path, nrows=1).iloc[0]
     coefficient_df = pd.read_csv(coefficients_path)
-    owner_summary = _read_optional_csv(tables_dir / "owner_data_availability_summary.csv")
-    student_corr = _read_optional_csv(tables_dir / "student_housing_correlation_summary.csv")
+    owner_row = _read_summary_row(tables_dir / "owner_data_availability_summary.csv")
+    student_row = _read_summary_row(tables_dir / "student_housing_correlation_summary.csv")
 
-    top_positive = coefficient_df.sort_values("standardized_coefficient", ascending=False).head(3)
-    top_negative = coefficient_df.sort_values("standardized_coefficient", ascending=True).head(3)
+    top_positive = coefficient_df.nlargest(3, "standardized_coefficient")
+    top_negative = coefficient_df.nsmallest(3, "standardized_coefficient")
 
     lines = [
         "# March Check-In Summary",
@@ -71,8 +72,7 @@ def write_checkin_summary(
         ),
     ]
 
-    if owner_summary is not None and not owner_summary.empty:
-        owner_row = owner_summary.iloc[0]
+    if owner_row is not None:
         lines.append(
             "- Owner coverage in the property-risk table: "
             f"{float(owner_row['owner_data_available_pct']):.1f}% "
@@ -129,8 +129,7 @@ def write_checkin_summary(
             ),
         ]
     )
-    if student_corr is not None and not student_corr.empty:
-        student_row = student_corr.iloc[0]
+    if student_row is not None:
         relationship_x_metric = student_row.get(
             "relationship_x_metric_label",
             student_row.get("student_metric_column", "student_housing_metric"),
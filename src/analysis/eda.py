@@ -109,28 +109,27 @@ def _save_student_housing_relationship_figure(
         edgecolors="white",
         linewidths=0.8,
     )
+    x_values = plot_df[x_col].astype(float).to_numpy()
+    y_values = plot_df[y_col].astype(float).to_numpy()
     if plot_df[x_col].nunique() >= 2:
-        x_values = plot_df[x_col].astype(float).to_numpy()
-        y_values = plot_df[y_col].astype(float).to_numpy()
         slope, intercept = np.polyfit(x_values, y_values, 1)
         x_line = np.linspace(x_values.min(), x_values.max(), 100)
         ax.plot(x_line, slope * x_line + intercept, linestyle="--", linewidth=1.5)
-    centered_x = plot_df[x_col].astype(float) - float(plot_df[x_col].astype(float).mean())
-    centered_y = plot_df[y_col].astype(float) - float(plot_df[y_col].astype(float).mean())
-    std_x = float(plot_df[x_col].astype(float).std(ddof=0) or 0.0)
-    std_y = float(plot_df[y_col].astype(float).std(ddof=0) or 0.0)
+    std_x = float(x_values.std())
+    std_y = float(y_values.std())
     outlier_score = (
-        centered_x.abs() / (std_x if std_x else 1.0)
-        + centered_y.abs() / (std_y if std_y else 1.0)
+        np.abs(x_values - x_values.mean()) / (std_x if std_x else 1.0)
+        + np.abs(y_values - y_values.mean()) / (std_y if std_y else 1.0)
     )
     plot_df = plot_df.assign(outlier_score=outlier_score)
     label_df = plot_df.nlargest(min(6, len(plot_df)), "outlier_score")
-    for idx, (_, row) in enumerate(label_df.iterrows()):
+    label_rows = zip(label_df[zip_col].tolist(), label_df[x_col].tolist(), label_df[y_col].tolist())
+    for idx, (zip_code, x_value, y_value) in enumerate(label_rows):
         x_offset = 4 if idx % 2 == 0 else -18
         y_offset = 4 if idx % 3 else -10
         ax.annotate(
-            str(row[zip_col]),
-            (row[x_col], row[y_col]),
+            str(zip_code),
+            (x_value, y_value),
             textcoords="offset points",
             xytext=(x_offset, y_offset),
             fontsize=8,
@@ -166,8 +165,7 @@ def _save_student_housing_ranked_bar_figure(
 
     plot_df = (
         df.dropna(subset=[zip_col, y_col])
-        .sort_values(y_col, ascending=False)
-        .head(10)
+        .nlargest(10, y_col)
         .copy()
     )
     if plot_df.empty:
@@ -348,7 +346,7 @@ def generate_property_risk_outputs(
                         ]
                         if column is not None and column in repeated.columns
                     ],
-                ].sort_values("total_violations", ascending=False).head(20)
+                ].nlargest(20, "total_violations")
                 table_paths.append(
                     _write_table(
                         repeated_table,
@@ -393,7 +391,7 @@ def generate_property_risk_outputs(
             class_summary["property_count"],
         )
         class_summary = class_summary.loc[class_summary["property_count"] >= 25].copy()
-        class_summary = class_summary.sort_values("violations_per_property", ascending=False).head(15)
+        class_summary = class_summary.nlargest(15, "violations_per_property")
         if not class_summary.empty:
             table_paths.append(
                 _write_table(class_summary, tables_dir / "violations_by_property_class.csv")
@@ -598,7 +596,7 @@ def generate_student_housing_outputs(
             )
         try:
             label_zip_codes = (
-                table_source.sort_values(ranking_col, ascending=False)[zip_col]
+                table_summary[zip_col]
                 .head(5)
                 .astype("string")
                 .tolist()
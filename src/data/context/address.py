@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-import re
 
 import pandas as pd
 
@@ -12,11 +11,12 @@ from src.data.features import normalize_address, normalize_string, normalize_zip
 from src.data.violations import _standardize_columns
 
 from .common import (
-    build_address_zip_key,
     download_arcgis_layer,
     find_local_file,
+    join_address_zip_key,
     load_existing_clean_output,
     load_local_tabular,
+    normalize_identifier,
     save_clean_output,
 )
 
@@ -36,17 +36,6 @@ class AddressContextConfig:
     sam_clean_output: Path = Path("data/processed/sam_addresses_clean.csv")
 
 
-def _normalize_identifier(value: object) -> str:
-    if value is None or pd.isna(value):
-        return ""
-    if isinstance(value, float) and value.is_integer():
-        return str(int(value))
-    text = str(value).strip()
-    if re.fullmatch(r"\d+\.0+", text):
-        return text.split(".", 1)[0]
-    return normalize_string(text).replace(" ", "")
-
-
 def _address_from_parts(df: pd.DataFrame) -> pd.Series:
     pieces = []
     for column in ["st_no", "street_number", "house_number", "st_name", "street_name", "street", "st_suffix", "street_suffix"]:
@@ -132,13 +121,14 @@ def clean_sam_addresses(df: pd.DataFrame) -> pd.DataFrame:
     else:
         working["sam_zip"] = pd.Series(pd.NA, index=working.index, dtype="string")
 
-    working["sam_address_clean"] = working["sam_address"].map(normalize_address).astype("string")
-    working["sam_address_zip_key"] = build_address_zip_key(working, "sam_address", "sam_zip")
-    working["sam_address_only_key"] = working["sam_address"].map(normalize_address).astype("string")
+    sam_address_clean = working["sam_address"].map(normalize_address).astype("string")
+    working["sam_address_clean"] = sam_address_clean
+    working["sam_address_zip_key"] = join_address_zip_key(sam_address_clean, working["sam_zip"].fillna(""))
+    working["sam_address_only_key"] = sam_address_clean.copy()
 
     for column in ["map_par_id", "loc_id", "gis_id", "pid"]:
         if column in working.columns:
-            working[column] = working[column].map(_normalize_identifier).astype("string")
+            working[column] = working[column].map(normalize_identifier).astype("string")
 
     for column in ["neighborhood", "planning_district", "district", "ward"]:
         if column in working.columns:
@@ -11,7 +11,7 @@ from typing import Any
 import pandas as pd
 import requests
 
-from src.data.features import normalize_address, normalize_zip
+from src.data.features import FLOAT_ARTIFACT_PATTERN, normalize_address, normalize_string, normalize_zip
 
 
 def _retry_delay_seconds(attempt: int) -> int:
@@ -432,7 +432,7 @@ def load_local_tabular(path: Path) -> pd.DataFrame:
     if suffix in {".xlsx", ".xls"}:
         return pd.read_excel(path)
     if suffix in {".json", ".geojson"}:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json.loads(path.read_bytes())
         if isinstance(payload, dict) and "features" in payload:
             rows = [feature.get("properties", {}) for feature in payload.get("features", [])]
             return pd.DataFrame(rows)
@@ -471,9 +471,27 @@ def build_address_zip_key_from_series(
     zip_code: pd.Series,
 ) -> pd.Series:
     """Create a normalized address+ZIP join key from two series."""
-    normalized_address = address.map(normalize_address).astype("string")
-    normalized_zip = zip_code.map(normalize_zip).astype("string")
-    key = normalized_address.str.cat(normalized_zip, sep="|")
+    return join_address_zip_key(address.map(normalize_address), zip_code.map(normalize_zip))
+
+
+def normalize_identifier(value: object) -> str:
+    """Normalize parcel, SAM, and case identifiers for cross-source joins."""
+    if value is None or pd.isna(value):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    text = str(value).strip()
+    if FLOAT_ARTIFACT_PATTERN.fullmatch(text):
+        return text.split(".", 1)[0]
+    return normalize_string(text).replace(" ", "")
+
+
+def join_address_zip_key(
+    normalized_address: pd.Series,
+    normalized_zip: pd.Series,
+) -> pd.Series:
+    """Join already-normalized address and ZIP values into an address+ZIP key."""
+    key = normalized_address.astype("string").str.cat(normalized_zip.astype("string"), sep="|")
     return key.str.strip("|").astype("string")
 
 
@@ -17,6 +17,7 @@ from .common import (
     find_local_file,
     load_existing_clean_output,
     load_local_tabular,
+    normalize_identifier,
     save_clean_output,
 )
 
@@ -27,6 +28,10 @@ PERMITS_URL = (
 )
 MAJOR_PERMIT_TOKENS = {"addition", "alteration", "renovation", "foundation", "structural", "demolition"}
 OCCUPANCY_PERMIT_TOKENS = {"occupancy", "certificate", "dwelling", "residential", "use change"}
+MAJOR_PERMIT_PATTERN = re.compile("|".join(re.escape(token) for token in sorted(MAJOR_PERMIT_TOKENS)))
+OCCUPANCY_PERMIT_PATTERN = re.compile(
+    "|".join(re.escape(token) for token in sorted(OCCUPANCY_PERMIT_TOKENS))
+)
 
 
 @dataclass(frozen=True)
@@ -46,23 +51,16 @@ class PermitContextConfig:
     download_max_attempts: int = 3
 
 
-def _normalize_identifier(value: object) -> str:
-    if value is None or pd.isna(value):
-        return ""
-    if isinstance(value, float) and value.is_integer():
-        return str(int(value))
-    text = str(value).strip()
-    if re.fullmatch(r"\d+\.0+", text):
-        return text.split(".", 1)[0]
-    return normalize_string(text).replace(" ", "")
-
-
 def _coerce_permit_datetime(series: pd.Series) -> pd.Series:
     """Parse permit timestamps from either ISO strings or epoch milliseconds."""
     numeric = pd.to_numeric(series, errors="coerce")
     parsed_numeric = pd.to_datetime(numeric, unit="ms", errors="coerce")
-    parsed_text = pd.to_datetime(series, errors="coerce")
-    return parsed_numeric.where(parsed_numeric.notna(), parsed_text)
+    text_rows = (parsed_numeric.isna() & series.notna()).to_numpy()
+    if not text_rows.any():
+        return parsed_numeric
+    parsed = parsed_numeric.copy()
+    parsed[text_rows] = pd.to_datetime(series[text_rows], errors="coerce").to_numpy()
+    return parsed
 
 
 def clean_permits(df: pd.DataFrame) -> pd.DataFrame:
@@ -116,7 +114,7 @@ def clean_permits(df: pd.DataFrame) -> pd.DataFrame:
         cleaned["permit_zip"] = cleaned[zip_col].map(normalize_zip).astype("string")
     for column in ["map_par_id", "loc_id", "gis_id", "pid"]:
         if column in cleaned.columns:
-            cleaned[column] = cleaned[column].map(_normalize_identifier).astype("string")
+            cleaned[column] = cleaned[column].map(normalize_identifier).astype("string")
     if issued_col:
         cleaned["permit_issue_date"] = _coerce_permit_datetime(cleaned[issued_col])
 
@@ -125,11 +123,9 @@ def clean_permits(df: pd.DataFrame) -> pd.DataFrame:
         if permit_text_cols
         else pd.Series("", index=cleaned.index, dtype="string")
     )
-    cleaned["major_permit_flag"] = permit_text.apply(
-        lambda text: int(any(token in text for token in MAJOR_PERMIT_TOKENS))
-    )
-    cleaned["occupancy_related_permit_flag"] = permit_text.apply(
-        lambda text: int(any(token in text for token in OCCUPANCY_PERMIT_TOKENS))
+    cleaned["major_permit_flag"] = permit_text.str.contains(MAJOR_PERMIT_PATTERN).astype(int)
+    cleaned["occupancy_related_permit_flag"] = (
+        permit_text.str.contains(OCCUPANCY_PERMIT_PATTERN).astype(int)
     )
     cleaned["permit_record_count"] = 1
     return cleaned
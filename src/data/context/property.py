@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import re
-from typing import Any
+from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 
-from src.data.features import normalize_address, normalize_string, normalize_zip
+from src.data.features import _map_distinct, normalize_address, normalize_string, normalize_zip
 from src.data.violations import _standardize_columns
 
 from .acs import ACSContextConfig, load_acs_context
@@ -19,6 +22,7 @@ from .common import (
     find_local_file,
     load_existing_clean_output,
     load_local_tabular,
+    normalize_identifier,
     save_clean_output,
 )
 from .permits import PermitContextConfig, aggregate_permits, load_permits
@@ -38,6 +42,31 @@ PARCELS_CURRENT_URL = (
     "Parcels_current/FeatureServer/0/query"
 )
 
+CONTEXT_RATE_FLAGS = {
+    "sam_match_rate_pct": "sam_match_flag",
+    "assessment_match_rate_pct": "assessment_match_flag",
+    "parcel_match_rate_pct": "parcel_context_flag",
+    "rentsmart_match_rate_pct": "rentsmart_match_flag",
+    "service_request_context_rate_pct": "service_request_context_flag",
+    "permit_context_rate_pct": "permit_context_flag",
+    "acs_context_rate_pct": "acs_context_flag",
+    "owner_data_rate_pct": "owner_data_available_flag",
+}
+LEGAL_SUFFIXES = (
+    "llc",
+    "inc",
+    "corp",
+    "corporation",
+    "co",
+    "company",
+    "lp",
+    "l p",
+    "llp",
+    "trust",
+    "trs",
+)
+LEGAL_SUFFIX_PATTERN = re.compile(rf"(?:\b(?:{'|'.join(LEGAL_SUFFIXES)})\b\s*)+$")
+
 
 @dataclass(frozen=True)
 class PropertyDataConfig:
@@ -56,7 +85,11 @@ class PropertyDataConfig:
 
 def normalize_owner_text(value: object) -> str:
     """Normalize owner text while carefully trimming common legal suffix noise."""
-    text = normalize_string(value)
+    return _normalize_owner_normalized_text(normalize_string(value))
+
+
+@lru_cache(maxsize=65536)
+def _normalize_owner_normalized_text(text: str) -> str:
     if not text:
         return ""
     text = re_sub_legal_suffixes(text)
@@ -65,33 +98,12 @@ def normalize_owner_text(value: object) -> str:
 
 def re_sub_legal_suffixes(text: str) -> str:
     """Remove a small set of common trailing legal suffixes conservatively."""
-    suffixes = [
-        "llc",
-        "inc",
-        "corp",
-        "corporation",
-        "co",
-        "company",
-        "lp",
-        "l p",
-        "llp",
-        "trust",
-        "trs",
-    ]
-    pattern = rf"(?:\b(?:{'|'.join(suffixes)})\b\s*)+$"
-    return pd.Series([text]).str.replace(pattern, "", regex=True).iloc[0].strip()
+    return LEGAL_SUFFIX_PATTERN.sub("", text).strip()
 
 
 def normalize_property_identifier(value: object) -> str:
     """Normalize parcel/property identifiers for cross-source joins."""
-    if value is None or pd.isna(value):
-        return ""
-    if isinstance(value, float) and value.is_integer():
-        return str(int(value))
-    text = str(value).strip()
-    if re.fullmatch(r"\d+\.0+", text):
-        return text.split(".", 1)[0]
-    return normalize_string(text).replace(" ", "")
+    return normalize_identifier(value)
 
 
 def _load_remote_csv_or_layer(query_url: str | None, output_path: Path) -> Path | None:
@@ -130,38 +142,41 @@ def _load_context_source(
     return cleaned
 
 
-def _coalesce_lookup(
+def _match_join_candidates(
     base_df: pd.DataFrame,
     join_df: pd.DataFrame,
-    *,
-    source_column: str,
     join_candidates: list[tuple[str, str]],
-) -> pd.Series:
-    values = pd.Series(pd.NA, index=base_df.index, dtype="object")
-    if source_column not in join_df.columns:
-        return values
-
+) -> list[tuple[str, str, pd.DataFrame, np.ndarray]]:
+    """Resolve each usable join candidate to matched join-row positions once."""
+    matches: list[tuple[str, str, pd.DataFrame, np.ndarray]] = []
     for left_col, right_col in join_candidates:
         if left_col not in base_df.columns or right_col not in join_df.columns:
             continue
+        deduped = join_df.dropna(subset=[right_col]).drop_duplicates(subset=[right_col], keep="first")
+        positions = pd.Index(deduped[right_col]).get_indexer(base_df[left_col])
+        matches.append((left_col, right_col, deduped, positions))
+    return matches
+
+
+def _coalesce_lookup(
+    base_df: pd.DataFrame,
+    *,
+    source_column: str,
+    matches: list[tuple[str, str, pd.DataFrame, np.ndarray]],
+) -> pd.Series:
+    values = pd.Series(pd.NA, index=base_df.index, dtype="object")
+    for left_col, right_col, deduped, positions in matches:
         if source_column == right_col:
-            valid_keys = (
-                join_df[right_col]
-                .dropna()
-                .drop_duplicates()
-                .astype("string")
-            )
+            valid_keys = deduped[right_col].astype("string")
             candidate = base_df[left_col].astype("string")
             matched = candidate.where(candidate.isin(valid_keys))
             fill_mask = values.isna() & matched.notna()
             values.loc[fill_mask] = matched.loc[fill_mask]
             continue
-        lookup = (
-            join_df.dropna(subset=[right_col])
-            .drop_duplicates(subset=[right_col], keep="first")
-            .set_index(right_col)[source_column]
-        )
-        matched = base_df[left_col].map(lookup)
+        found = positions >= 0
+        matched_values = np.full(len(base_df), pd.NA, dtype=object)
+        matched_values[found] = deduped[source_column].to_numpy(dtype=object)[positions[found]]
+        matched = pd.Series(matched_values, index=base_df.index, dtype="object")
         fill_mask = values.isna() & matched.notna()
         values.loc[fill_mask] = matched.loc[fill_mask]
     return values
@@ -177,14 +192,15 @@ def _assign_lookup_columns(
 ) -> None:
     if join_df is None:
         return
-    for column in source_columns:
-        if column not in join_df.columns:
-            continue
+    columns = [column for column in source_columns if column in join_df.columns]
+    if not columns:
+        return
+    matches = _match_join_candidates(base_df, join_df, join_candidates)
+    for column in columns:
         base_df[f"{prefix}{column}"] = _coalesce_lookup(
             base_df,
-            join_df,
             source_column=column,
-            join_candidates=join_candidates,
+            matches=matches,
         )
 
 
@@ -200,6 +216,14 @@ def _normalize_street_number(value: object) -> str:
     return text
 
 
+def _present_flag(df: pd.DataFrame, pattern: str) -> pd.Series | int:
+    """Flag rows where any column matching ``pattern`` is populated."""
+    matched = df.filter(regex=pattern)
+    if matched.empty:
+        return 0
+    return matched.notna().any(axis=1).astype(int)
+
+
 def _positive_flag(series: pd.Series | None, index: pd.Index) -> pd.Series:
     """Convert an optional numeric-like series into a 0/1 availability flag."""
     if series is None:
@@ -250,7 +274,7 @@ def clean_property_assessment(df: pd.DataFrame) -> pd.DataFrame:
         cleaned["owner_available_flag"] = cleaned["owner_clean"].fillna("").str.len().gt(0).astype(int)
     if {"st_num", "st_name"}.issubset(cleaned.columns):
         cleaned["property_address"] = (
-            cleaned["st_num"].map(_normalize_street_number).astype("string").str.strip()
+            _map_distinct(cleaned["st_num"], _normalize_street_number).str.strip()
             + " "
             + cleaned["st_name"].fillna("").astype("string").str.strip()
         ).str.replace(r"\s+", " ", regex=True).str.strip()
@@ -371,23 +395,41 @@ def _aggregate_rentsmart_join(rentsmart_df: pd.DataFrame, join_key: str) -> pd.D
         for column in working.columns
         if any(token in column for token in ["complaint", "violation", "inspection", "issue"])
     ]
-    complaint_signal = working[complaint_cols].notna().any(axis=1).astype(int) if complaint_cols else 0
+    keys = working[join_key]
+    aggregated = keys.groupby(keys).size().rename("rentsmart_record_count").to_frame()
+    aggregated["rentsmart_history_flag"] = 1
+    if complaint_cols:
+        complaint_signal = working[complaint_cols].notna().any(axis=1).astype(int)
+        aggregated["rentsmart_complaint_indicator"] = complaint_signal.groupby(keys).max()
+    else:
+        aggregated["rentsmart_complaint_indicator"] = 0
+    return aggregated.rename_axis(join_key).reset_index()
 
-    aggregated = (
-        working.assign(
-            rentsmart_record_count=1,
-            rentsmart_history_flag=1,
-            rentsmart_complaint_indicator=complaint_signal,
-        )
-        .groupby(join_key)
-        .agg(
-            rentsmart_record_count=("rentsmart_record_count", "sum"),
-            rentsmart_history_flag=("rentsmart_history_flag", "max"),
-            rentsmart_complaint_indicator=("rentsmart_complaint_indicator", "max"),
-        )
-        .reset_index()
-    )
-    return aggregated
+
+def _aggregate_join_candidates(
+    aggregate: Callable[..., pd.DataFrame],
+    source_df: pd.DataFrame,
+    risk_df: pd.DataFrame,
+    join_candidates: list[tuple[str, str]],
+    *,
+    reference_date: pd.Timestamp | None,
+) -> pd.DataFrame | None:
+    """Aggregate a context source once per source key and stack it under each risk-table key."""
+    usable = [
+        (left_col, right_col)
+        for left_col, right_col in join_candidates
+        if right_col in source_df.columns and left_col in risk_df.columns
+    ]
+    if not usable:
+        return None
+
+    aggregated_by_key: dict[str, pd.DataFrame] = {}
+    frames: list[pd.DataFrame] = []
+    for left_col, right_col in usable:
+        if right_col not in aggregated_by_key:
+            aggregated_by_key[right_col] = aggregate(source_df, join_key=right_col, reference_date=reference_date)
+        frames.append(aggregated_by_key[right_col].rename(columns={right_col: left_col}))
+    return pd.concat(frames, ignore_index=False)
 
 
 def _context_configs(config: PropertyDataConfig) -> tuple[AddressContextConfig, ServiceRequestConfig, PermitContextConfig, ACSContextConfig]:
@@ -553,20 +595,17 @@ def build_property_risk_table(
             ("address_zip_key", "address_zip_key"),
             ("address_only_key", "address_only_key"),
         ]
-        aggregated_frames: list[tuple[str, pd.DataFrame]] = []
-        for left_col, right_col in rentsmart_candidates:
-            if left_col in risk_df.columns and right_col in rentsmart_df.columns:
-                aggregated_frames.append(
-                    (
-                        left_col,
-                        _aggregate_rentsmart_join(rentsmart_df, right_col).rename(columns={right_col: left_col}),
-                    )
-                )
+        aggregated_by_key: dict[str, pd.DataFrame] = {}
         joined = False
-        for left_col, aggregated in aggregated_frames:
-            if left_col not in aggregated.columns or aggregated.empty:
+        for left_col, right_col in rentsmart_candidates:
+            if left_col not in risk_df.columns or right_col not in rentsmart_df.columns:
                 continue
-            risk_df = risk_df.merge(aggregated, on=left_col, how="left")
+            if right_col not in aggregated_by_key:
+                aggregated_by_key[right_col] = _aggregate_rentsmart_join(rentsmart_df, right_col)
+            aggregated = aggregated_by_key[right_col]
+            if aggregated.empty:
+                continue
+            risk_df = risk_df.merge(aggregated.rename(columns={right_col: left_col}), on=left_col, how="left")
             joined = True
             if left_col.startswith("assessment_") or left_col.startswith("sam_"):
                 diagnostics["rentsmart_join_type"] = "identifier_exact"
@@ -584,16 +623,13 @@ def build_property_risk_table(
         ]
         _assign_lookup_columns(
             risk_df,
-            pd.concat(
-                [
-                    aggregate_service_requests(service_requests_df, join_key=right_col, reference_date=reference_date).rename(columns={right_col: left_col})
-                    for left_col, right_col in service_candidates
-                    if right_col in service_requests_df.columns and left_col in risk_df.columns
-                ],
-                ignore_index=False,
-            )
-            if any(right_col in service_requests_df.columns and left_col in risk_df.columns for left_col, right_col in service_candidates)
-            else None,
+            _aggregate_join_candidates(
+                aggregate_service_requests,
+                service_requests_df,
+                risk_df,
+                service_candidates,
+                reference_date=reference_date,
+            ),
             join_candidates=[(left_col, left_col) for left_col, right_col in service_candidates if left_col in risk_df.columns],
             source_columns=[
                 "service_request_count",
@@ -619,16 +655,13 @@ def build_property_risk_table(
         ]
         _assign_lookup_columns(
             risk_df,
-            pd.concat(
-                [
-                    aggregate_permits(permits_df, join_key=right_col, reference_date=reference_date).rename(columns={right_col: left_col})
-                    for left_col, right_col in permit_candidates
-                    if right_col in permits_df.columns and left_col in risk_df.columns
-                ],
-                ignore_index=False,
-            )
-            if any(right_col in permits_df.columns and left_col in risk_df.columns for left_col, right_col in permit_candidates)
-            else None,
+            _aggregate_join_candidates(
+                aggregate_permits,
+                permits_df,
+                risk_df,
+                permit_candidates,
+                reference_date=reference_date,
+            ),
             join_candidates=[(left_col, left_col) for left_col, right_col in permit_candidates if left_col in risk_df.columns],
             source_columns=[
                 "permit_count",
@@ -649,21 +682,9 @@ def build_property_risk_table(
     if acs_df is not None and {"violation_zip", "acs_zip"}.issubset(risk_df.columns.union(acs_df.columns)):
         risk_df = risk_df.merge(acs_df, left_on="violation_zip", right_on="acs_zip", how="left")
 
-    risk_df["sam_match_flag"] = (
-        risk_df.filter(regex=r"^sam_(map_par_id|loc_id|gis_id|pid|neighborhood)$").notna().any(axis=1).astype(int)
-        if not risk_df.filter(regex=r"^sam_(map_par_id|loc_id|gis_id|pid|neighborhood)$").empty
-        else 0
-    )
-    risk_df["assessment_match_flag"] = (
-        risk_df.filter(regex=r"^assessment_(map_par_id|loc_id|gis_id|pid)$").notna().any(axis=1).astype(int)
-        if not risk_df.filter(regex=r"^assessment_(map_par_id|loc_id|gis_id|pid)$").empty
-        else 0
-    )
-    risk_df["parcel_context_flag"] = (
-        risk_df.filter(regex=r"^parcel_").notna().any(axis=1).astype(int)
-        if not risk_df.filter(regex=r"^parcel_").empty
-        else 0
-    )
+    risk_df["sam_match_flag"] = _present_flag(risk_df, r"^sam_(map_par_id|loc_id|gis_id|pid|neighborhood)$")
+    risk_df["assessment_match_flag"] = _present_flag(risk_df, r"^assessment_(map_par_id|loc_id|gis_id|pid)$")
+    risk_df["parcel_context_flag"] = _present_flag(risk_df, r"^parcel_")
     risk_df["owner_data_available_flag"] = (
         risk_df["assessment_owner_clean"].fillna("").astype("string").str.len().gt(0).astype(int)
         if "assessment_owner_clean" in risk_df.columns
@@ -672,46 +693,37 @@ def build_property_risk_table(
     risk_df["rentsmart_match_flag"] = _positive_flag(risk_df.get("rentsmart_record_count"), risk_df.index)
     risk_df["service_request_context_flag"] = _positive_flag(risk_df.get("service_request_count"), risk_df.index)
     risk_df["permit_context_flag"] = _positive_flag(risk_df.get("permit_count"), risk_df.index)
-    risk_df["acs_context_flag"] = (
-        risk_df.filter(regex=r"^acs_").notna().any(axis=1).astype(int)
-        if not risk_df.filter(regex=r"^acs_").empty
-        else 0
-    )
+    risk_df["acs_context_flag"] = _present_flag(risk_df, r"^acs_")
 
-    diagnostics["sam_match_rate_pct"] = round(float(risk_df["sam_match_flag"].mean() * 100), 1)
-    diagnostics["assessment_match_rate_pct"] = round(float(risk_df["assessment_match_flag"].mean() * 100), 1)
-    diagnostics["parcel_match_rate_pct"] = round(float(risk_df["parcel_context_flag"].mean() * 100), 1)
-    diagnostics["rentsmart_match_rate_pct"] = round(float(risk_df["rentsmart_match_flag"].mean() * 100), 1)
-    diagnostics["service_request_context_rate_pct"] = round(float(risk_df["service_request_context_flag"].mean() * 100), 1)
-    diagnostics["permit_context_rate_pct"] = round(float(risk_df["permit_context_flag"].mean() * 100), 1)
-    diagnostics["acs_context_rate_pct"] = round(float(risk_df["acs_context_flag"].mean() * 100), 1)
-    diagnostics["owner_data_rate_pct"] = round(float(risk_df["owner_data_available_flag"].mean() * 100), 1)
+    flag_rates = risk_df[list(CONTEXT_RATE_FLAGS.values())].mean() * 100
+    for diagnostic_key, flag_column in CONTEXT_RATE_FLAGS.items():
+        diagnostics[diagnostic_key] = round(float(flag_rates[flag_column]), 1)
     diagnostics["parcel_context_rate_pct"] = diagnostics["parcel_match_rate_pct"]
     return risk_df, diagnostics
 
 
-def save_property_risk_table(config: PropertyDataConfig, feature_table_path: Path) -> tuple[Path, dict[str, Any]]:
+def save_property_risk_table(
+    config: PropertyDataConfig,
+    feature_table_path: Path,
+    *,
+    max_workers: int = 4,
+) -> tuple[Path, dict[str, Any]]:
     """Build and save the enriched property-risk table."""
-    feature_df = pd.read_csv(feature_table_path, low_memory=False)
-    property_assessment_df = load_property_assessment(config)
-    parcels_df = load_parcels(config)
-    rentsmart_df = load_rentsmart(config)
     address_config, service_config, permit_config, acs_config = _context_configs(config)
-    sam_df = load_sam_addresses(address_config)
-    service_requests_df = load_service_requests(service_config)
-    permits_df = load_permits(permit_config)
-    acs_df = load_acs_context(acs_config)
-
-    risk_df, diagnostics = build_property_risk_table(
-        feature_df,
-        property_assessment_df=property_assessment_df,
-        parcels_df=parcels_df,
-        rentsmart_df=rentsmart_df,
-        sam_df=sam_df,
-        service_requests_df=service_requests_df,
-        permits_df=permits_df,
-        acs_df=acs_df,
-    )
+    feature_df = pd.read_csv(feature_table_path, low_memory=False)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        context_futures = {
+            "property_assessment_df": executor.submit(load_property_assessment, config),
+            "parcels_df": executor.submit(load_parcels, config),
+            "rentsmart_df": executor.submit(load_rentsmart, config),
+            "sam_df": executor.submit(load_sam_addresses, address_config),
+            "service_requests_df": executor.submit(load_service_requests, service_config),
+            "permits_df": executor.submit(load_permits, permit_config),
+            "acs_df": executor.submit(load_acs_context, acs_config),
+        }
+        context_frames = {name: future.result() for name, future in context_futures.items()}
+
+    risk_df, diagnostics = build_property_risk_table(feature_df, **context_frames)
     config.property_risk_output.parent.mkdir(parents=True, exist_ok=True)
     risk_df.to_csv(config.property_risk_output, index=False)
     print(f"Property risk table saved to: {config.property_risk_output}")
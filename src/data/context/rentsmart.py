@@ -124,7 +124,7 @@ def build_query_payload(
 def _decode_raw_bytes(raw_bytes: bytes, content_encoding: str | None) -> dict[str, Any]:
     if content_encoding and "gzip" in content_encoding.lower():
         raw_bytes = gzip.decompress(raw_bytes)
-    return json.loads(raw_bytes.decode("utf-8"))
+    return json.loads(raw_bytes)
 
 
 def _coerce_datetime(raw_value: Any, fmt: str | None) -> Any:
@@ -157,24 +157,24 @@ def _resolve_display_value(
     return raw_value
 
 
-def unpack_powerbi_rows(
+def _unpack_powerbi_values(
     headers: dict[str, dict[str, Any]],
     rows: list[dict[str, Any]],
     value_dicts: dict[str, list[Any]] | None = None,
-) -> list[dict[str, Any]]:
+) -> tuple[list[str], list[tuple[Any, ...]]]:
     if not rows:
-        return []
+        return [], []
 
     first_row = rows[0]
     column_count = len(first_row.get("S", [])) or len(first_row.get("C", []))
     if column_count == 0:
-        return []
+        return [], []
 
     previous_row: list[Any] = [None] * column_count
     column_names = [f"column_{idx}" for idx in range(column_count)]
     column_specs: list[dict[str, Any] | None] = [None] * column_count
     header_specs: list[dict[str, Any] | None] = [None] * column_count
-    unpacked_rows: list[dict[str, Any]] = []
+    unpacked_rows: list[tuple[Any, ...]] = []
 
     for row in rows:
         if "S" in row:
@@ -186,43 +186,64 @@ def unpack_powerbi_rows(
                 if header_spec:
                     column_names[idx] = header_spec.get("Name", column_names[idx])
 
-        current_row: list[Any] = [None] * column_count
         copy_mask = int(row.get("R", 0) or 0)
         null_mask = int(row.get("Ø", 0) or 0)
         values = row.get("C", [])
-        value_index = 0
-        column_mask = 1
-
-        for idx in range(column_count):
-            if copy_mask & column_mask:
-                current_row[idx] = previous_row[idx]
-            elif null_mask & column_mask:
-                current_row[idx] = None
-            else:
-                raw_value = values[value_index] if value_index < len(values) else None
-                current_row[idx] = _resolve_display_value(
-                    raw_value,
+
+        if not copy_mask | null_mask:
+            current_row = [
+                _resolve_display_value(
+                    values[idx] if idx < len(values) else None,
                     column_specs[idx],
                     header_specs[idx],
                     value_dicts,
                 )
-                value_index += 1
-
-            previous_row[idx] = current_row[idx]
-            column_mask <<= 1
+                for idx in range(column_count)
+            ]
+        else:
+            current_row = [None] * column_count
+            value_index = 0
+            column_mask = 1
+            for idx in range(column_count):
+                if copy_mask & column_mask:
+                    current_row[idx] = previous_row[idx]
+                elif not null_mask & column_mask:
+                    raw_value = values[value_index] if value_index < len(values) else None
+                    current_row[idx] = _resolve_display_value(
+                        raw_value,
+                        column_specs[idx],
+                        header_specs[idx],
+                        value_dicts,
+                    )
+                    value_index += 1
+                column_mask <<= 1
+
+        previous_row = current_row
+        unpacked_rows.append(tuple(current_row))
+
+    return column_names, unpacked_rows
 
-        unpacked_rows.append(dict(zip(column_names, current_row)))
 
-    return unpacked_rows
+def unpack_powerbi_rows(
+    headers: dict[str, dict[str, Any]],
+    rows: list[dict[str, Any]],
+    value_dicts: dict[str, list[Any]] | None = None,
+) -> list[dict[str, Any]]:
+    column_names, values = _unpack_powerbi_values(headers, rows, value_dicts)
+    return [dict(zip(column_names, row_values)) for row_values in values]
 
 
-def parse_powerbi_response(response_json: dict[str, Any]) -> dict[str, Any]:
+def _parse_powerbi_page(response_json: dict[str, Any]) -> dict[str, Any]:
     data = response_json["results"][0]["result"]["data"]
     headers = {column["Value"]: column for column in data["descriptor"]["Select"]}
     dataset = data["dsr"]["DS"][0]
     primary_hierarchy = dataset["PH"][0]
     row_key = next(iter(primary_hierarchy))
-    rows = unpack_powerbi_rows(headers, primary_hierarchy[row_key], dataset.get("ValueDicts"))
+    columns, row_values = _unpack_powerbi_values(
+        headers,
+        primary_hierarchy[row_key],
+        dataset.get("ValueDicts"),
+    )
 
     row_count = None
     for event in data.get("metrics", {}).get("Events", []):
@@ -232,13 +253,21 @@ def parse_powerbi_response(response_json: dict[str, Any]) -> dict[str, Any]:
             break
 
     return {
-        "rows": rows,
+        "columns": columns,
+        "row_values": row_values,
         "restart_tokens": dataset.get("RT", []),
         "is_complete": bool(dataset.get("IC")),
         "row_count": row_count,
     }
 
 
+def parse_powerbi_response(response_json: dict[str, Any]) -> dict[str, Any]:
+    page = _parse_powerbi_page(response_json)
+    columns = page.pop("columns")
+    row_values = page.pop("row_values")
+    return {"rows": [dict(zip(columns, values)) for values in row_values], **page}
+
+
 def _request_page(payload: dict[str, Any], config: RentSmartDownloadConfig) -> dict[str, Any]:
     request = Request(
         config.querydata_url,
@@ -254,8 +283,7 @@ def _request_page(payload: dict[str, Any], config: RentSmartDownloadConfig) -> d
         return _decode_raw_bytes(response.read(), response.headers.get("Content-Encoding"))
 
 
-def _build_export_frame(rows: list[dict[str, Any]]) -> pd.DataFrame:
-    frame = pd.DataFrame(rows)
+def _build_export_frame(frame: pd.DataFrame) -> pd.DataFrame:
     if frame.empty:
         return frame
 
@@ -306,7 +334,8 @@ def download_rentsmart_csv(config: RentSmartDownloadConfig = RentSmartDownloadCo
     output_path = Path(config.output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    all_rows: list[dict[str, Any]] = []
+    page_frames: list[pd.DataFrame] = []
+    total_rows = 0
     restart_tokens: list[list[str]] | None = None
     page_number = 1
     seen_restart_tokens: set[str] = set()
@@ -321,13 +350,15 @@ def download_rentsmart_csv(config: RentSmartDownloadConfig = RentSmartDownloadCo
             user_preferred_locale=config.user_preferred_locale,
         )
         response_json = _request_page(payload, config)
-        parsed = parse_powerbi_response(response_json)
-        page_rows = parsed["rows"]
-        all_rows.extend(page_rows)
+        parsed = _parse_powerbi_page(response_json)
+        page_rows = parsed["row_values"]
+        if page_rows:
+            page_frames.append(pd.DataFrame(page_rows, columns=parsed["columns"], dtype=object))
+        total_rows += len(page_rows)
 
         print(
             f"Downloaded RentSmart page {page_number}: "
-            f"{len(page_rows)} decoded rows; total rows so far: {len(all_rows)}"
+            f"{len(page_rows)} decoded rows; total rows so far: {total_rows}"
         , flush=True)
         restart_tokens = parsed["restart_tokens"] or None
         if not restart_tokens:
@@ -338,7 +369,8 @@ def download_rentsmart_csv(config: RentSmartDownloadConfig = RentSmartDownloadCo
         seen_restart_tokens.add(restart_key)
         page_number += 1
 
-    frame = _build_export_frame(all_rows).drop_duplicates().reset_index(drop=True)
+    combined = pd.concat(page_frames, ignore_index=True).infer_objects() if page_frames else pd.DataFrame()
+    frame = _build_export_frame(combined).drop_duplicates().reset_index(drop=True)
     if frame.empty:
         raise RentSmartDownloadError("RentSmart export completed, but no rows were decoded.")
 
@@ -348,11 +380,11 @@ def download_rentsmart_csv(config: RentSmartDownloadConfig = RentSmartDownloadCo
     return output_path
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Download the public RentSmart Boston dataset.")
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_PATH)
     parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     download_rentsmart_csv(
         RentSmartDownloadConfig(
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-import io
 from pathlib import Path
 import re
 from typing import Any
@@ -19,6 +19,7 @@ from .common import (
     find_local_file,
     load_existing_clean_output,
     load_local_tabular,
+    normalize_identifier,
     save_clean_output,
 )
 
@@ -39,6 +40,7 @@ HOUSING_RELATED_TOKENS = {
     "occupancy",
     "building",
 }
+HOUSING_RELATED_PATTERN = re.compile("|".join(re.escape(token) for token in sorted(HOUSING_RELATED_TOKENS)))
 SERVICE_REQUEST_USECOLS = {
     "case_enquiry_id",
     "case_id",
@@ -91,17 +93,6 @@ class ServiceRequestConfig:
     years_back: int = 1
 
 
-def _normalize_identifier(value: object) -> str:
-    if value is None or pd.isna(value):
-        return ""
-    if isinstance(value, float) and value.is_integer():
-        return str(int(value))
-    text = str(value).strip()
-    if re.fullmatch(r"\d+\.0+", text):
-        return text.split(".", 1)[0]
-    return normalize_string(text).replace(" ", "")
-
-
 def _service_request_usecol(column_name: str) -> bool:
     return _standardize_columns([column_name])[0] in SERVICE_REQUEST_USECOLS
 
@@ -123,11 +114,40 @@ def _select_service_request_resources(
     return selected
 
 
+def _download_service_request_resource(resource: dict[str, Any], timeout: int) -> pd.DataFrame | None:
+    url = resource.get("url")
+    if not url:
+        return None
+    try:
+        with requests.get(
+            str(url),
+            timeout=timeout,
+            headers={"User-Agent": "Mozilla/5.0"},
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            frame = pd.read_csv(
+                response.raw,
+                encoding=response.encoding or "utf-8",
+                low_memory=False,
+                usecols=_service_request_usecol,
+            )
+    except Exception as exc:
+        print(f"Skipping 311 resource {resource.get('name') or resource.get('id')}: {exc}")
+        return None
+    if frame.empty:
+        return None
+    frame["source_resource_name"] = resource.get("name")
+    return frame
+
+
 def _download_service_requests_bulk(
     config: ServiceRequestConfig,
     timeout: int = 60,
     *,
     force_refresh: bool = False,
+    max_workers: int = 4,
 ) -> Path | None:
     target_path = config.raw_dir / config.candidates[0]
     if target_path.exists() and not force_refresh:
@@ -149,30 +169,12 @@ def _download_service_requests_bulk(
         print("Skipping 311 bulk download: no matching CSV resources were found.")
         return None
 
-    frames: list[pd.DataFrame] = []
-    for resource in selected:
-        url = resource.get("url")
-        if not url:
-            continue
-        try:
-            response = requests.get(
-                str(url),
-                timeout=timeout,
-                headers={"User-Agent": "Mozilla/5.0"},
-            )
-            response.raise_for_status()
-            frame = pd.read_csv(
-                io.StringIO(response.text),
-                low_memory=False,
-                usecols=_service_request_usecol,
-            )
-        except Exception as exc:
-            print(f"Skipping 311 resource {resource.get('name') or resource.get('id')}: {exc}")
-            continue
-        if frame.empty:
-            continue
-        frame["source_resource_name"] = resource.get("name")
-        frames.append(frame)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(selected)))) as executor:
+        downloaded = executor.map(
+            lambda resource: _download_service_request_resource(resource, timeout),
+            selected,
+        )
+        frames = [frame for frame in downloaded if frame is not None]
 
     if not frames:
         print("Skipping 311 bulk download: all matching resources failed to load.")
@@ -199,10 +201,13 @@ def _download_service_requests_bulk(
 def _should_refresh_service_request_raw(path: Path) -> bool:
     """Detect obviously broken bulk snapshots so they can be refreshed automatically."""
     try:
-        preview = pd.read_csv(path, low_memory=False)
+        header = pd.read_csv(path, nrows=0)
+        if "source_resource_name" not in header.columns:
+            return False
+        preview = pd.read_csv(path, usecols=["source_resource_name"], nrows=1000)
     except Exception:
         return True
-    return "source_resource_name" in preview.columns and len(preview) < 1000
+    return len(preview) < 1000
 
 
 def _best_service_request_address(df: pd.DataFrame) -> pd.Series:
@@ -269,7 +274,7 @@ def clean_service_requests(df: pd.DataFrame) -> pd.DataFrame:
 
     for column in ["map_par_id", "loc_id", "gis_id", "pid"]:
         if column in cleaned.columns:
-            cleaned[column] = cleaned[column].map(_normalize_identifier).astype("string")
+            cleaned[column] = cleaned[column].map(normalize_identifier).astype("string")
 
     cleaned["service_request_address"] = _best_service_request_address(cleaned).map(normalize_address).astype("string")
 
@@ -305,8 +310,8 @@ def clean_service_requests(df: pd.DataFrame) -> pd.DataFrame:
     if issue_text_cols:
         combined_text = cleaned[issue_text_cols].fillna("").astype("string").agg(" ".join, axis=1)
         normalized_text = combined_text.map(normalize_string)
-        cleaned["housing_related_request_flag"] = normalized_text.apply(
-            lambda text: int(any(token in text for token in HOUSING_RELATED_TOKENS))
+        cleaned["housing_related_request_flag"] = (
+            normalized_text.str.contains(HOUSING_RELATED_PATTERN).astype(int)
         )
     else:
         cleaned["housing_related_request_flag"] = 0
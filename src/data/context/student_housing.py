@@ -34,14 +34,11 @@ def normalize_school_name(value: object) -> str:
     return normalize_string(value)
 
 
-def normalize_year_value(value: object) -> int | None:
-    """Convert a year-like value to an integer when possible."""
-    if value is None or pd.isna(value):
-        return None
-    digits = "".join(ch for ch in str(value) if ch.isdigit())
-    if len(digits) >= 4:
-        return int(digits[:4])
-    return None
+def normalize_year_series(series: pd.Series) -> pd.Series:
+    """Convert year-like values to numeric years when at least four digits are present."""
+    digits = series.astype("string").str.replace(r"\D+", "", regex=True)
+    years = digits.str[:4].where(digits.str.len().ge(4))
+    return pd.to_numeric(years.astype(object), errors="coerce")
 
 
 def load_student_housing_data(config: StudentHousingConfig) -> tuple[pd.DataFrame | None, dict[str, Any]]:
@@ -120,7 +117,7 @@ def clean_student_housing(df: pd.DataFrame) -> pd.DataFrame:
         cleaned[f"{column}_clean"] = cleaned[column].map(normalize_school_name).astype("string")
 
     for column in [column for column in cleaned.columns if "year" in column or "academic_year" in column]:
-        cleaned[column] = cleaned[column].map(normalize_year_value)
+        cleaned[column] = normalize_year_series(cleaned[column])
 
     for column in [column for column in cleaned.columns if "zip" in column]:
         cleaned[column] = cleaned[column].map(normalize_zip).astype("string")
@@ -14,12 +14,16 @@ reports the limitation explicitly.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import re
 from typing import Any, Iterable
 
+import numpy as np
 import pandas as pd
 
+from src.data.violations import OPEN_STATUSES
+
 
 DEFAULT_INPUT_PATH = Path("data/processed/violations_clean.csv")
 DEFAULT_OUTPUT_PATH = Path("data/processed/violations_feature_table_v1.csv")
@@ -27,6 +31,7 @@ DEFAULT_RAW_PATH = Path("data/raw/violations.csv")
 
 DATE_COLUMN_CANDIDATES = ["violdttm", "violation_date", "status_dttm", "date"]
 STATUS_COLUMN_CANDIDATES = ["status"]
+CLOSED_STATUSES = {"closed", "resolved"}
 VIOLATION_TYPE_CANDIDATES = ["violationtype", "violationtype_descr", "description"]
 RAW_SUPPLEMENT_COLUMNS = [
     "case_no",
@@ -37,6 +42,27 @@ RAW_SUPPLEMENT_COLUMNS = [
     "violation_zip",
 ]
 
+_NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+_ASCII_NON_ALNUM_TABLE = str.maketrans(
+    {chr(code): " " for code in range(128) if not ("a" <= chr(code) <= "z" or "0" <= chr(code) <= "9")}
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+FLOAT_ARTIFACT_PATTERN = re.compile(r"\d+\.0+")
+_NON_DIGIT_PATTERN = re.compile(r"\D+")
+_ASCII_NON_DIGIT_BYTES = bytes(code for code in range(128) if not 48 <= code <= 57)
+ADDRESS_ABBREVIATIONS = {
+    "avenue": "ave",
+    "av": "ave",
+    "street": "st",
+    "road": "rd",
+    "boulevard": "blvd",
+    "drive": "dr",
+    "place": "pl",
+    "court": "ct",
+    "terrace": "ter",
+}
+_ADDRESS_WORD_PATTERN = re.compile(rf"\b(?:{'|'.join(ADDRESS_ABBREVIATIONS)})\b")
+
 
 @dataclass(frozen=True)
 class Phase2FeatureConfig:
@@ -53,7 +79,14 @@ def _column_or_default(
 ) -> pd.Series:
     if column not in df.columns:
         return pd.Series("", index=index, dtype="string")
-    return df[column].map(normalizer).astype("string")
+    return _map_distinct(df[column], normalizer)
+
+
+def _map_distinct(values: pd.Series, normalizer) -> pd.Series:
+    """Apply ``normalizer`` once per distinct value and broadcast back to every row."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    normalized = np.array([normalizer(value) for value in uniques], dtype=object)
+    return pd.Series(normalized[codes], index=values.index, dtype="string")
 
 
 def first_available_column(df: pd.DataFrame, candidates: Iterable[str]) -> str | None:
@@ -65,40 +98,44 @@ def normalize_string(value: object) -> str:
     """Normalize generic strings for grouping and comparison."""
     if value is None or pd.isna(value):
         return ""
+    return _normalize_text(str(value))
+
 
-    text = str(value).strip().lower()
-    text = re.sub(r"[^a-z0-9]+", " ", text)
-    return re.sub(r"\s+", " ", text).strip()
+@lru_cache(maxsize=131072)
+def _normalize_text(text: str) -> str:
+    text = text.strip().lower()
+    if text.isascii():
+        return " ".join(text.translate(_ASCII_NON_ALNUM_TABLE).split())
+    text = _NON_ALNUM_PATTERN.sub(" ", text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
 
 
 def normalize_address(value: object) -> str:
     """Normalize an address-like string without pretending to standardize USPS format."""
-    text = normalize_string(value)
-    replacements = {
-        r"\bavenue\b": "ave",
-        r"\bav\b": "ave",
-        r"\bstreet\b": "st",
-        r"\broad\b": "rd",
-        r"\bboulevard\b": "blvd",
-        r"\bdrive\b": "dr",
-        r"\bplace\b": "pl",
-        r"\bcourt\b": "ct",
-        r"\bterrace\b": "ter",
-    }
-    for pattern, replacement in replacements.items():
-        text = re.sub(pattern, replacement, text)
-    return re.sub(r"\s+", " ", text).strip()
+    return _normalize_address_text(normalize_string(value))
+
+
+@lru_cache(maxsize=131072)
+def _normalize_address_text(text: str) -> str:
+    return _ADDRESS_WORD_PATTERN.sub(lambda match: ADDRESS_ABBREVIATIONS[match.group()], text)
 
 
 def normalize_zip(value: object) -> str:
     """Normalize ZIP values to a 5-character string when possible."""
     if value is None or pd.isna(value):
         return ""
+    return _normalize_zip_text(str(value))
+
 
-    text = str(value).strip()
-    if re.fullmatch(r"\d+\.0+", text):
+@lru_cache(maxsize=65536)
+def _normalize_zip_text(text: str) -> str:
+    text = text.strip()
+    if FLOAT_ARTIFACT_PATTERN.fullmatch(text):
         text = text.split(".", 1)[0]
-    digits = re.sub(r"\D+", "", text)
+    if text.isascii():
+        digits = text if text.isdigit() else text.encode().translate(None, _ASCII_NON_DIGIT_BYTES).decode()
+    else:
+        digits = _NON_DIGIT_PATTERN.sub("", text)
     if not digits:
         return ""
     return digits[:5].zfill(5)
@@ -142,7 +179,7 @@ def load_phase2_source_data(config: Phase2FeatureConfig) -> pd.DataFrame:
 
     df = pd.read_csv(config.input_path)
     if "violation_zip" in df.columns:
-        df["violation_zip"] = df["violation_zip"].map(normalize_zip).astype("string")
+        df["violation_zip"] = _map_distinct(df["violation_zip"], normalize_zip)
 
     if not config.raw_path.exists() or "case_no" not in df.columns:
         return df
@@ -213,38 +250,35 @@ def generate_property_key(df: pd.DataFrame) -> pd.Series:
     return property_key
 
 
-def _status_mask(df: pd.DataFrame, statuses: set[str]) -> pd.Series:
+def _status_masks(df: pd.DataFrame, *status_sets: set[str]) -> list[pd.Series]:
+    """Flag rows whose normalized status falls in each of ``status_sets``."""
     status_col = first_available_column(df, STATUS_COLUMN_CANDIDATES)
     if status_col is None:
-        return pd.Series(False, index=df.index)
-    return (
-        df[status_col]
-        .astype("string")
-        .str.strip()
-        .str.lower()
-        .isin(statuses)
-        .fillna(False)
-    )
-
-
-def _top_non_empty(series: pd.Series) -> str | pd.NA:
-    cleaned = series.dropna().astype("string")
-    cleaned = cleaned[cleaned.str.len() > 0]
-    if cleaned.empty:
-        return pd.NA
-    return cleaned.mode().iloc[0]
+        return [pd.Series(False, index=df.index) for _ in status_sets]
+    status = df[status_col].astype("category")
+    categories = status.cat.categories.astype("string").str.strip().str.lower()
+    codes = status.cat.codes.to_numpy()
+    return [
+        pd.Series(np.isin(codes, np.flatnonzero(categories.isin(statuses))), index=df.index)
+        for statuses in status_sets
+    ]
 
 
-def _recent_violation_count(
-    group: pd.DataFrame,
-    date_col: str,
-    reference_date: pd.Timestamp,
-) -> int:
-    dates = group[date_col].dropna()
-    if dates.empty:
-        return 0
-    window_start = reference_date - pd.Timedelta(days=365)
-    return int(dates.ge(window_start).sum())
+def _top_non_empty_by_key(values: pd.Series, key_codes: np.ndarray, key_count: int) -> np.ndarray:
+    """Return the most frequent non-empty value per key code, breaking ties alphabetically."""
+    values = values.astype("string")
+    non_empty = (values.notna() & values.str.len().gt(0).fillna(False)).to_numpy()
+    value_codes, value_uniques = pd.factorize(values[non_empty], sort=True)
+    value_count = max(len(value_uniques), 1)
+    pairs, counts = np.unique(key_codes[non_empty] * value_count + value_codes, return_counts=True)
+    pair_keys, pair_values = np.divmod(pairs, value_count)
+    order = np.lexsort((pair_values, -counts, pair_keys))
+    pair_keys = pair_keys[order]
+    first_in_key = np.ones(len(order), dtype=bool)
+    first_in_key[1:] = pair_keys[1:] != pair_keys[:-1]
+    top_values = np.full(key_count, pd.NA, dtype=object)
+    top_values[pair_keys[first_in_key]] = np.asarray(value_uniques, dtype=object)[pair_values[order][first_in_key]]
+    return top_values
 
 
 def _aligned_group_values(
@@ -264,6 +298,20 @@ def _aligned_group_values(
     return values.reset_index(drop=True)
 
 
+def _assign_top_non_empty(
+    feature_table: pd.DataFrame,
+    prepared: pd.DataFrame,
+    key_codes: np.ndarray,
+    source_column: str,
+    target_column: str,
+) -> None:
+    feature_table.loc[:, target_column] = _top_non_empty_by_key(
+        prepared[source_column],
+        key_codes,
+        len(feature_table),
+    )
+
+
 def _assign_grouped_column(
     feature_table: pd.DataFrame,
     grouped: pd.core.groupby.DataFrameGroupBy,
@@ -289,13 +337,13 @@ def prepare_violations_frame(df: pd.DataFrame) -> tuple[pd.DataFrame, str | None
     prepared = df.copy()
     date_col = coerce_datetime_column(prepared, DATE_COLUMN_CANDIDATES)
 
+    if "violation_zip" in prepared.columns:
+        prepared["violation_zip"] = _map_distinct(prepared["violation_zip"], normalize_zip)
+
     property_key, property_key_source = generate_property_key_components(prepared)
     prepared.loc[:, "property_key"] = property_key
     prepared.loc[:, "property_key_source"] = property_key_source
 
-    if "violation_zip" in prepared.columns:
-        prepared["violation_zip"] = prepared["violation_zip"].map(normalize_zip).astype("string")
-
     if date_col is not None:
         prepared.loc[:, "year"] = prepared[date_col].dt.year
         prepared.loc[:, "month"] = prepared[date_col].dt.month
@@ -341,26 +389,46 @@ def get_property_key_diagnostics(prepared_df: pd.DataFrame) -> dict[str, Any]:
 def build_feature_table(df: pd.DataFrame) -> pd.DataFrame:
     """Aggregate the cleaned violations table to a property-level feature table."""
     prepared, date_col = prepare_violations_frame(df)
+    return build_feature_table_from_prepared(prepared, date_col)
+
+
+def build_feature_table_from_prepared(
+    prepared: pd.DataFrame,
+    date_col: str | None,
+) -> pd.DataFrame:
+    """Aggregate an already prepared violations frame without re-normalizing it."""
+    open_mask, closed_mask = _status_masks(prepared, OPEN_STATUSES, CLOSED_STATUSES)
+    prepared = prepared.assign(_open_flag=open_mask.astype(int), _closed_flag=closed_mask.astype(int))
     grouped = prepared.groupby("property_key", dropna=False)
 
     feature_table = grouped.size().rename("total_violations").reset_index()
-    feature_table.loc[:, "open_violations"] = grouped.apply(
-        lambda group: int(_status_mask(group, {"open", "pending", "active"}).sum()),
-        include_groups=False,
-    ).to_numpy()
-    feature_table.loc[:, "closed_violations"] = grouped.apply(
-        lambda group: int(_status_mask(group, {"closed", "resolved"}).sum()),
-        include_groups=False,
-    ).to_numpy()
+    key_codes = pd.Index(feature_table["property_key"]).get_indexer(prepared["property_key"]).astype(np.int64)
+    _assign_grouped_column(
+        feature_table,
+        grouped,
+        "_open_flag",
+        "open_violations",
+        "sum",
+        fill_value=0,
+        dtype=int,
+    )
+    _assign_grouped_column(
+        feature_table,
+        grouped,
+        "_closed_flag",
+        "closed_violations",
+        "sum",
+        fill_value=0,
+        dtype=int,
+    )
 
     if "property_key_source" in prepared.columns:
-        _assign_grouped_column(
+        _assign_top_non_empty(
             feature_table,
-            grouped,
+            prepared,
+            key_codes,
             "property_key_source",
             "property_key_source",
-            _top_non_empty,
-            dtype="string",
         )
 
     violation_type_col = first_available_column(prepared, VIOLATION_TYPE_CANDIDATES)
@@ -374,34 +442,31 @@ def build_feature_table(df: pd.DataFrame) -> pd.DataFrame:
             fill_value=0,
             dtype=int,
         )
-        _assign_grouped_column(
+        _assign_top_non_empty(
             feature_table,
-            grouped,
+            prepared,
+            key_codes,
             violation_type_col,
             "primary_violation_type",
-            _top_non_empty,
-            dtype="string",
         )
     else:
         feature_table.loc[:, "distinct_violation_types"] = 0
 
     if "violation_st" in prepared.columns:
-        _assign_grouped_column(
+        _assign_top_non_empty(
             feature_table,
-            grouped,
+            prepared,
+            key_codes,
             "violation_st",
             "violation_st",
-            _top_non_empty,
-            dtype="string",
         )
     if "violation_zip" in prepared.columns:
-        _assign_grouped_column(
+        _assign_top_non_empty(
             feature_table,
-            grouped,
+            prepared,
+            key_codes,
             "violation_zip",
             "violation_zip",
-            _top_non_empty,
-            dtype="string",
         )
 
     if date_col is not None:
@@ -421,9 +486,13 @@ def build_feature_table(df: pd.DataFrame) -> pd.DataFrame:
         if pd.notna(reference_date):
             recency = (reference_date - last_violation).dt.days.fillna(0).clip(lower=0)
             feature_table.loc[:, "days_since_last_violation"] = recency.astype(int).to_numpy()
-            recent_counts = grouped.apply(
-                lambda group: _recent_violation_count(group, date_col, reference_date),
-                include_groups=False,
+            window_start = reference_date - pd.Timedelta(days=365)
+            recent_counts = (
+                prepared[date_col]
+                .ge(window_start)
+                .astype(int)
+                .groupby(prepared["property_key"], dropna=False)
+                .sum()
             )
             feature_table.loc[:, "recent_violation_count_365d"] = (
                 recent_counts.reindex(feature_table["property_key"]).fillna(0).astype(int).to_numpy()
@@ -474,12 +543,19 @@ def print_feature_summary(
             print(f"  - {column}: {pct:.1f}%")
 
 
-def run_phase2_feature_engineering(config: Phase2FeatureConfig) -> Path:
+def run_phase2_feature_engineering(
+    config: Phase2FeatureConfig,
+    source_df: pd.DataFrame | None = None,
+    prepared: pd.DataFrame | None = None,
+    date_col: str | None = None,
+) -> Path:
     """Load cleaned violations data, build Phase 2 features, and save them."""
-    source_df = load_phase2_source_data(config)
-    prepared, _ = prepare_violations_frame(source_df)
+    if prepared is None:
+        if source_df is None:
+            source_df = load_phase2_source_data(config)
+        prepared, date_col = prepare_violations_frame(source_df)
     diagnostics = get_property_key_diagnostics(prepared)
-    feature_table = build_feature_table(source_df)
+    feature_table = build_feature_table_from_prepared(prepared, date_col)
 
     config.output_path.parent.mkdir(parents=True, exist_ok=True)
     feature_table.to_csv(config.output_path, index=False)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import re
 
@@ -14,6 +15,20 @@ VIOLATIONS_CSV_URL = (
     "800a2663-1d6a-46e7-9356-bedb70f5332c?format=csv"
 )
 
+VIOLATION_COLUMNS: tuple[str, ...] = (
+    "case_no",
+    "status",
+    "description",
+    "violationtype",
+    "violationtype_descr",
+    "violation_st",
+    "violation_zip",
+    "violator_name",
+    "violdttm",
+)
+COLUMN_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9]+")
+OPEN_STATUSES = {"open", "pending", "active"}
+
 
 @dataclass(frozen=True)
 class Phase1Config:
@@ -24,58 +39,72 @@ class Phase1Config:
     prepare_optional_sources: bool = True
 
 
+@lru_cache(maxsize=4096)
+def _standardize_column_name(column: str) -> str:
+    return COLUMN_SEPARATOR_PATTERN.sub("_", column.strip().lower()).strip("_")
+
+
 def _standardize_columns(columns: list[str]) -> list[str]:
-    clean_cols = []
-    for col in columns:
-        col = col.strip().lower()
-        col = re.sub(r"[^a-z0-9]+", "_", col)
-        col = re.sub(r"_+", "_", col).strip("_")
-        clean_cols.append(col)
-    return clean_cols
+    return [_standardize_column_name(col) for col in columns]
+
+
+def _violation_usecol(column_name: str) -> bool:
+    return _standardize_columns([column_name])[0] in VIOLATION_COLUMNS
+
 
+def read_raw_violations(path: Path) -> pd.DataFrame:
+    """Read the raw violations CSV, skipping columns that clean_violations drops."""
+    header = pd.read_csv(path, nrows=0)
+    usecols = _violation_usecol if any(_violation_usecol(column) for column in header.columns) else None
+    return pd.read_csv(path, usecols=usecols)
 
-def download_violations_csv(url: str, output_path: Path, timeout: int = 30) -> None:
+
+def download_violations_csv(
+    url: str,
+    output_path: Path,
+    timeout: int = 30,
+    chunk_size: int = 1 << 20,
+) -> None:
     import requests
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    response = requests.get(url, timeout=timeout)
-    response.raise_for_status()
-    output_path.write_bytes(response.content)
+    partial_path = output_path.with_name(f"{output_path.name}.part")
+    try:
+        with requests.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            with partial_path.open("wb") as handle:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    handle.write(chunk)
+    except Exception:
+        partial_path.unlink(missing_ok=True)
+        raise
+    partial_path.replace(output_path)
 
 
 def clean_violations(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df.columns = _standardize_columns(df.columns.tolist())
+    columns = pd.Index(_standardize_columns(df.columns.tolist()))
 
     # Keep a stable subset when available.
-    expected_cols = [
-        "case_no",
-        "status",
-        "description",
-        "violationtype",
-        "violationtype_descr",
-        "violation_st",
-        "violation_zip",
-        "violator_name",
-        "violdttm",
-    ]
-    cols = [c for c in expected_cols if c in df.columns]
+    cols = [c for c in VIOLATION_COLUMNS if c in columns]
     if cols:
-        df = df.loc[:, cols].copy()
+        positions = columns.get_indexer_for(cols)
+        df = df.iloc[:, positions].copy()
+        df.columns = columns[positions]
+    else:
+        df = df.copy()
+        df.columns = columns
+
+    if "case_no" in df.columns:
+        df = df.drop_duplicates(subset=["case_no"], keep="first")
 
     if "status" in df.columns:
         status = df["status"].astype("string").str.strip().str.lower()
-        status = status.fillna("unknown")
-        df.loc[:, "status"] = status
+        df["status"] = status.fillna("unknown").astype("category")
     if "violdttm" in df.columns:
-        df.loc[:, "violdttm"] = pd.to_datetime(df["violdttm"], errors="coerce")
-    if "case_no" in df.columns:
-        df = df.drop_duplicates(subset=["case_no"], keep="first")
+        df["violdttm"] = pd.to_datetime(df["violdttm"], errors="coerce")
 
     if "status" in df.columns:
-        df.loc[:, "is_open_violation"] = df["status"].isin(
-            ["open", "pending", "active"]
-        ).astype(int)
+        df["is_open_violation"] = df["status"].isin(OPEN_STATUSES).astype("int8")
 
     return df
 
@@ -182,7 +211,7 @@ def run_phase1(config: Phase1Config) -> tuple[Path, Path]:
 
     download_violations_csv(VIOLATIONS_CSV_URL, raw_path)
 
-    df = pd.read_csv(raw_path)
+    df = read_raw_violations(raw_path)
     cleaned = clean_violations(df)
 
     cleaned_path.parent.mkdir(parents=True, exist_ok=True)
@@ -26,7 +26,7 @@ from src.data.features import (
     DEFAULT_INPUT_PATH,
     DEFAULT_RAW_PATH,
     Phase2FeatureConfig,
-    build_feature_table,
+    build_feature_table_from_prepared,
     load_phase2_source_data,
     prepare_violations_frame,
 )
@@ -108,18 +108,18 @@ def build_property_level_modeling_frame(
     if future.empty:
         raise ValueError("No future rows remain inside the prediction window.")
 
-    modeling_df = build_feature_table(historical)
+    modeling_df = build_feature_table_from_prepared(historical, date_col)
     severity_counts = _severity_count_columns(historical)
     modeling_df = modeling_df.merge(severity_counts, on="property_key", how="left")
 
     future_targets = (
-        future.groupby("property_key")
+        future.assign(
+            _high_risk_flag=future["severity_proxy"].eq(HIGH_RISK_LABEL).fillna(False).astype(int)
+        )
+        .groupby("property_key")
         .agg(
             future_violation_count=("property_key", "size"),
-            future_high_risk_violation_count=(
-                "severity_proxy",
-                lambda values: int(values.astype("string").eq(HIGH_RISK_LABEL).sum()),
-            ),
+            future_high_risk_violation_count=("_high_risk_flag", "sum"),
         )
         .reset_index()
     )
@@ -125,7 +125,11 @@ def main() -> None:
     property_key_diagnostics = get_property_key_diagnostics(prepared)
     trend_date_col = get_available_date_column(prepared.copy())
 
-    feature_path = run_phase2_feature_engineering(feature_config)
+    feature_path = run_phase2_feature_engineering(
+        feature_config,
+        prepared=prepared,
+        date_col=feature_date_col,
+    )
     property_risk_path, property_risk_diagnostics = save_property_risk_table(
         PropertyDataConfig(),
         feature_path,
@@ -6,11 +6,12 @@ import json
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import requests
 from src.viz.plot_utils import plt, save_figure
 from matplotlib.collections import PatchCollection
-from matplotlib.colors import Normalize
+from matplotlib.colors import Normalize, to_rgba
 from matplotlib.patches import Polygon
 
 from src.data.features import normalize_zip
@@ -35,7 +36,7 @@ def load_boston_zip_boundaries(
 ) -> dict[str, Any]:
     """Load official Boston ZIP boundaries from cache or the ArcGIS GeoJSON endpoint."""
     if cache_path.exists():
-        cached = json.loads(cache_path.read_text())
+        cached = json.loads(cache_path.read_bytes())
         if _is_feature_collection(cached):
             return cached
 
@@ -46,21 +47,23 @@ def load_boston_zip_boundaries(
         raise ValueError("Boston ZIP boundary endpoint returned an unexpected payload.")
 
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    cache_path.write_text(json.dumps(payload))
+    cache_path.write_bytes(response.content)
     return payload
 
 
-def _outer_rings(geometry: dict[str, Any] | None) -> list[list[list[float]]]:
+def _outer_rings(geometry: dict[str, Any] | None) -> list[np.ndarray]:
     if not geometry:
         return []
 
     coordinates = geometry.get("coordinates") or []
     geometry_type = geometry.get("type")
     if geometry_type == "Polygon":
-        return [coordinates[0]] if coordinates else []
-    if geometry_type == "MultiPolygon":
-        return [polygon[0] for polygon in coordinates if polygon]
-    return []
+        rings = [coordinates[0]] if coordinates else []
+    elif geometry_type == "MultiPolygon":
+        rings = [polygon[0] for polygon in coordinates if polygon]
+    else:
+        return []
+    return [np.asarray(ring, dtype=float)[:, :2] for ring in rings if ring]
 
 
 def _zip_property_value(properties: dict[str, Any]) -> str | None:
@@ -70,10 +73,10 @@ def _zip_property_value(properties: dict[str, Any]) -> str | None:
     return None
 
 
-def _ring_center(ring: list[list[float]]) -> tuple[float, float]:
-    x_values = [point[0] for point in ring]
-    y_values = [point[1] for point in ring]
-    return ((min(x_values) + max(x_values)) / 2.0, (min(y_values) + max(y_values)) / 2.0)
+def _ring_center(ring: np.ndarray) -> tuple[float, float]:
+    x_min, y_min = ring.min(axis=0)
+    x_max, y_max = ring.max(axis=0)
+    return (float(x_min + x_max) / 2.0, float(y_min + y_max) / 2.0)
 
 
 def plot_zip_level_choropleth(
@@ -137,22 +140,21 @@ def plot_zip_level_choropleth(
     if not patches:
         raise ValueError("Boston ZIP boundary file did not include usable polygon geometry.")
 
-    valid_values = [value for value in patch_values if pd.notna(value)]
-    if not valid_values:
+    value_array = np.asarray(patch_values, dtype=float)
+    valid_mask = ~np.isnan(value_array)
+    if not valid_mask.any():
         raise ValueError("ZIP boundary map loaded, but none of the ZIP values matched the summary table.")
 
-    min_value = min(valid_values)
-    max_value = max(valid_values)
+    min_value = float(value_array[valid_mask].min())
+    max_value = float(value_array[valid_mask].max())
     if min_value == max_value:
         max_value = min_value + 1.0
     norm = Normalize(vmin=min_value, vmax=max_value)
     cmap = plt.get_cmap("YlOrRd")
 
     fig, ax = plt.subplots(figsize=(8.5, 8.5))
-    facecolors = [
-        "#e5e7eb" if pd.isna(value) else cmap(norm(value))
-        for value in patch_values
-    ]
+    facecolors = cmap(norm(value_array))
+    facecolors[~valid_mask] = to_rgba("#e5e7eb")
     collection = PatchCollection(
         patches,
         facecolor=facecolors,
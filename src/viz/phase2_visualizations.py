@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+import re
+
+import numpy as np
 import pandas as pd
 
 from src.data.features import (
@@ -31,6 +34,17 @@ DISTRICT_COLUMN_CANDIDATES = [
     "council_district",
 ]
 SEVERITY_COLUMN_CANDIDATES = ["severity", "severity_level", "violation_severity"]
+SEVERE_TEXT_PATTERN = re.compile(
+    r"fire|unsafe|danger|collapse|structural|hazard|emergency|life safety"
+)
+MODERATE_TEXT_PATTERN = re.compile(
+    r"maintenance|sanitary|mold|heat|electrical|plumbing|rodent|trash|"
+    r"ventilation|water|sewage|infest|habitable"
+)
+LOW_TEXT_PATTERN = re.compile(
+    r"permit|inspection|certificate|occupancy|right of entry|zoning|"
+    r"administrative|paperwork|documentation|sign|code"
+)
 FIGURE_OUTPUT_GROUPS = {
     "severity distribution": {"severity_distribution.png"},
     "status distribution": {"status_distribution.png"},
@@ -74,24 +88,14 @@ def _derive_severity_proxy(df: pd.DataFrame) -> pd.Series | None:
     if text_col is None:
         return None
 
-    text = df[text_col].astype("string").str.lower()
-    severe_pattern = (
-        r"fire|unsafe|danger|collapse|structural|hazard|emergency|life safety"
-    )
-    moderate_pattern = (
-        r"maintenance|sanitary|mold|heat|electrical|plumbing|rodent|trash|"
-        r"ventilation|water|sewage|infest|habitable"
-    )
-    low_pattern = (
-        r"permit|inspection|certificate|occupancy|right of entry|zoning|"
-        r"administrative|paperwork|documentation|sign|code"
-    )
-
-    severity = pd.Series("uncategorized", index=df.index, dtype="string")
-    severity.loc[text.str.contains(severe_pattern, na=False)] = "high risk (proxy)"
-    severity.loc[text.str.contains(moderate_pattern, na=False)] = "medium risk (proxy)"
-    severity.loc[text.str.contains(low_pattern, na=False)] = "low risk (proxy)"
-    return severity
+    codes, uniques = pd.factorize(df[text_col].astype("string"))
+    text = pd.Series(uniques, dtype="string").str.lower()
+    labels = pd.Series("uncategorized", index=text.index, dtype="string")
+    labels.loc[text.str.contains(SEVERE_TEXT_PATTERN, na=False)] = "high risk (proxy)"
+    labels.loc[text.str.contains(MODERATE_TEXT_PATTERN, na=False)] = "medium risk (proxy)"
+    labels.loc[text.str.contains(LOW_TEXT_PATTERN, na=False)] = "low risk (proxy)"
+    label_values = np.append(labels.to_numpy(dtype=object), "uncategorized")
+    return pd.Series(label_values[codes], index=df.index, dtype="string")
 
 
 def plot_severity_distribution(df: pd.DataFrame, output_dir: Path) -> Path:
@@ -1,12 +1,20 @@
+import io
+
 import pandas as pd
 import requests
 
 from src.data.context.acs import clean_acs_context
 from src.data.context.address import clean_sam_addresses
-from src.data.context.common import download_arcgis_layer
-from src.data.context.permits import aggregate_permits, clean_permits
+from src.data.context.common import download_arcgis_layer, normalize_identifier
+from src.data.context.permits import _coerce_permit_datetime, aggregate_permits, clean_permits
 from src.data.context.property import build_property_risk_table
-from src.data.context.service_requests import aggregate_service_requests, clean_service_requests
+from src.data.context.service_requests import (
+    ServiceRequestConfig,
+    _download_service_requests_bulk,
+    _should_refresh_service_request_raw,
+    aggregate_service_requests,
+    clean_service_requests,
+)
 
 
 def test_clean_sam_addresses_builds_normalized_keys_and_ids():
@@ -69,6 +77,68 @@ def test_clean_service_requests_handles_new_system_schema():
     assert out.iloc[0]["address_zip_key"] == "30 b st|02127"
 
 
+def test_should_refresh_service_request_raw_flags_small_bulk_snapshots(tmp_path):
+    small_bulk = tmp_path / "small_bulk.csv"
+    pd.DataFrame({"case_enquiry_id": [1, 2], "source_resource_name": ["2024", "2024"]}).to_csv(
+        small_bulk, index=False
+    )
+    full_bulk = tmp_path / "full_bulk.csv"
+    pd.DataFrame(
+        {"case_enquiry_id": range(1000), "source_resource_name": ["2024"] * 1000}
+    ).to_csv(full_bulk, index=False)
+    manual_export = tmp_path / "manual_export.csv"
+    pd.DataFrame({"case_enquiry_id": [1]}).to_csv(manual_export, index=False)
+
+    assert _should_refresh_service_request_raw(small_bulk) is True
+    assert _should_refresh_service_request_raw(full_bulk) is False
+    assert _should_refresh_service_request_raw(manual_export) is False
+    assert _should_refresh_service_request_raw(tmp_path / "missing.csv") is True
+
+
+def test_download_service_requests_bulk_combines_resources_in_listed_order(tmp_path, monkeypatch):
+    current_year = pd.Timestamp.today().year
+    resources = [
+        {"format": "CSV", "name": f"311 {current_year}", "url": "https://example.test/current.csv"},
+        {"format": "CSV", "name": "NEW SYSTEM", "url": "https://example.test/new.csv"},
+        {"format": "CSV", "name": "broken", "url": ""},
+    ]
+    bodies = {
+        "https://example.test/current.csv": "case_enquiry_id,reason,ignored\n1,Heat,x\n2,Trash,y\n",
+        "https://example.test/new.csv": "case_enquiry_id,reason\n2,Duplicate\n3,Rodent\n",
+    }
+
+    class FakeResponse:
+        def __init__(self, url):
+            self.url = url
+            self.encoding = "utf-8"
+            self.raw = io.BytesIO(bodies.get(url, "").encode("utf-8"))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return None
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"result": {"resources": resources}}
+
+    def fake_get(url, timeout, headers=None, stream=False):
+        del timeout, headers, stream
+        return FakeResponse(url)
+
+    monkeypatch.setattr("src.data.context.service_requests.requests.get", fake_get)
+
+    output_path = _download_service_requests_bulk(ServiceRequestConfig(raw_dir=tmp_path))
+
+    saved = pd.read_csv(output_path)
+    assert saved["case_enquiry_id"].tolist() == [1, 2, 3]
+    assert saved["reason"].tolist() == ["Heat", "Trash", "Rodent"]
+    assert "ignored" not in saved.columns
+
+
 def test_aggregate_permits_derives_major_and_recent_signals():
     df = pd.DataFrame(
         {
@@ -109,6 +179,25 @@ def test_clean_permits_parses_epoch_dates_and_maps_parcel_identifier():
     assert str(out.iloc[0]["permit_issue_date"]).startswith("2021-01-28")
 
 
+def test_coerce_permit_datetime_mixes_epoch_and_iso_rows_with_repeated_labels():
+    series = pd.Series([1611851366000, "2021-02-01", None, "2021-03-05"], index=[0, 0, 1, 1])
+
+    out = _coerce_permit_datetime(series)
+
+    assert list(out.index) == [0, 0, 1, 1]
+    assert str(out.iloc[0]).startswith("2021-01-28")
+    assert out.iloc[1] == pd.Timestamp("2021-02-01")
+    assert pd.isna(out.iloc[2])
+    assert out.iloc[3] == pd.Timestamp("2021-03-05")
+
+def test_normalize_identifier_strips_float_artifacts_and_spacing():
+    assert normalize_identifier(304512000.0) == "304512000"
+    assert normalize_identifier(" 0304512000.00 ") == "0304512000"
+    assert normalize_identifier("ab-12 c") == "ab12c"
+    assert normalize_identifier(None) == ""
+    assert normalize_identifier(pd.NA) == ""
+
+
 def test_clean_acs_context_derives_zip_level_features():
     df = pd.DataFrame(
         {
@@ -1,14 +1,18 @@
 from pathlib import Path
+import threading
 
 import pandas as pd
+import pytest
 
 from src.data.context.property import (
     PropertyDataConfig,
     build_property_risk_table,
     clean_property_assessment,
+    save_property_risk_table,
 )
 from src.data.context.student_housing import (
     StudentHousingConfig,
+    clean_student_housing,
     load_student_housing_data,
 )
 
@@ -82,6 +86,90 @@ def test_build_property_risk_table_joins_assessment_by_address():
     assert diagnostics["property_assessment_loaded"] is True
 
 
+def test_save_property_risk_table_passes_each_loaded_source_through(tmp_path: Path, monkeypatch):
+    feature_path = tmp_path / "features.csv"
+    pd.DataFrame(
+        {
+            "property_key": ["12 main st|02118"],
+            "violation_st": ["12 Main St"],
+            "violation_zip": ["02118"],
+            "total_violations": [3],
+        }
+    ).to_csv(feature_path, index=False)
+    assessment_df = pd.DataFrame(
+        {
+            "address_zip_key": ["12 main st|02118"],
+            "map_par_id": ["0001"],
+            "owner_clean": ["acme llc"],
+        }
+    )
+    monkeypatch.setattr("src.data.context.property.load_property_assessment", lambda config: assessment_df)
+    for loader in [
+        "load_parcels",
+        "load_rentsmart",
+        "load_sam_addresses",
+        "load_service_requests",
+        "load_permits",
+        "load_acs_context",
+    ]:
+        monkeypatch.setattr(f"src.data.context.property.{loader}", lambda config: None)
+
+    output_path, diagnostics = save_property_risk_table(
+        PropertyDataConfig(property_risk_output=tmp_path / "risk.csv"),
+        feature_path,
+    )
+
+    saved = pd.read_csv(output_path)
+    assert saved.iloc[0]["assessment_owner_clean"] == "acme llc"
+    assert diagnostics["property_assessment_loaded"] is True
+    assert diagnostics["sam_loaded"] is False
+
+
+CONTEXT_LOADERS = [
+    "load_property_assessment",
+    "load_parcels",
+    "load_rentsmart",
+    "load_sam_addresses",
+    "load_service_requests",
+    "load_permits",
+    "load_acs_context",
+]
+
+
+def test_save_property_risk_table_loads_concurrently_and_surfaces_loader_errors(tmp_path: Path, monkeypatch):
+    feature_path = tmp_path / "features.csv"
+    pd.DataFrame({"property_key": ["12 main st|02118"], "total_violations": [3]}).to_csv(feature_path, index=False)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_peer(config):
+        barrier.wait()
+
+    def fail(config):
+        raise ValueError("ACS download failed")
+
+    for loader in CONTEXT_LOADERS:
+        monkeypatch.setattr(f"src.data.context.property.{loader}", lambda config: None)
+    monkeypatch.setattr("src.data.context.property.load_property_assessment", wait_for_peer)
+    monkeypatch.setattr("src.data.context.property.load_parcels", wait_for_peer)
+    monkeypatch.setattr("src.data.context.property.load_acs_context", fail)
+
+    with pytest.raises(ValueError, match="ACS download failed"):
+        save_property_risk_table(PropertyDataConfig(property_risk_output=tmp_path / "risk.csv"), feature_path)
+
+
+def test_save_property_risk_table_reads_feature_table_before_loading_context(tmp_path: Path, monkeypatch):
+    calls = []
+    for loader in CONTEXT_LOADERS:
+        monkeypatch.setattr(f"src.data.context.property.{loader}", calls.append)
+
+    with pytest.raises(FileNotFoundError):
+        save_property_risk_table(
+            PropertyDataConfig(property_risk_output=tmp_path / "risk.csv"),
+            tmp_path / "missing_features.csv",
+        )
+
+    assert calls == []
+
 def test_load_student_housing_data_handles_missing_file(tmp_path: Path):
     student_df, diagnostics = load_student_housing_data(
         StudentHousingConfig(
@@ -124,3 +212,17 @@ def test_load_student_housing_data_uses_default_summary_when_local_missing(tmp_p
     assert diagnostics["student_housing_available"] is True
     assert diagnostics["grain"] == "summary_level"
     assert diagnostics["student_housing_default_source"] is True
+
+
+def test_clean_student_housing_normalizes_year_columns():
+    df = pd.DataFrame(
+        {
+            "Report Year": ["Fall 2023", "2022-23", None, "n/a"],
+            "ZIP": ["2134", "02215", "02115", "02118"],
+        }
+    )
+
+    out = clean_student_housing(df)
+
+    assert out["report_year"].iloc[:2].tolist() == [2023, 2022]
+    assert out["report_year"].iloc[2:].isna().all()
@@ -1,6 +1,14 @@
 import json
 
-from src.data.context.rentsmart import build_query_payload, parse_powerbi_response
+import pandas as pd
+
+from src.data.context.rentsmart import (
+    RentSmartDownloadConfig,
+    build_query_payload,
+    download_rentsmart_csv,
+    main,
+    parse_powerbi_response,
+)
 
 
 def test_build_query_payload_includes_restart_tokens_when_present():
@@ -69,3 +77,57 @@ def test_parse_powerbi_response_unpacks_rows_and_converts_dates():
         {"rentsmart.full_address": "12 Main St", "rentsmart.date": "2024-01-01"},
         {"rentsmart.full_address": "13 Main St", "rentsmart.date": "2024-01-01"},
     ]
+
+
+def test_main_parses_explicit_argv_in_process(tmp_path, monkeypatch):
+    captured = []
+    monkeypatch.setattr("src.data.context.rentsmart.download_rentsmart_csv", captured.append)
+
+    main(["--output", str(tmp_path / "rentsmart.csv"), "--page-size", "250"])
+
+    assert captured[0].output_path == tmp_path / "rentsmart.csv"
+    assert captured[0].page_size == 250
+
+
+def _page_response(rows, restart_tokens):
+    return {
+        "results": [
+            {
+                "result": {
+                    "data": {
+                        "descriptor": {
+                            "Select": [
+                                {"Value": "G0", "Name": "rentsmart.full_address"},
+                                {"Value": "G1", "Name": "rentsmart.zip_code"},
+                            ]
+                        },
+                        "dsr": {"DS": [{"PH": [{"DM0": rows}], "RT": restart_tokens}]},
+                    }
+                }
+            }
+        ]
+    }
+
+
+def test_download_rentsmart_csv_infers_column_types_across_pages(tmp_path, monkeypatch):
+    specs = [{"N": "G0"}, {"N": "G1"}]
+    pages = iter(
+        [
+            _page_response(
+                [
+                    {"S": specs, "C": ["12 Main St", 2134]},
+                    {"C": ["13 Main St", 2134]},
+                    {"C": ["14 Main St"], "\u00d8": 2},
+                ],
+                [["'14 Main St'"]],
+            ),
+            _page_response([{"S": specs, "C": ["15 Main St", "02215"]}], []),
+        ]
+    )
+    monkeypatch.setattr("src.data.context.rentsmart._request_page", lambda payload, config: next(pages))
+
+    output_path = download_rentsmart_csv(RentSmartDownloadConfig(output_path=tmp_path / "rentsmart.csv"))
+
+    out = pd.read_csv(output_path, dtype=str)
+    assert out["full_address"].tolist() == ["12 Main St", "13 Main St", "14 Main St", "15 Main St"]
+    assert out["zip_code"].fillna("").tolist() == ["2134", "2134", "", "02215"]
@@ -2,12 +2,14 @@ import pandas as pd
 
 from src.data.features import (
     build_feature_table,
+    build_feature_table_from_prepared,
     Phase2FeatureConfig,
     generate_property_key,
     get_property_key_diagnostics,
     load_phase2_source_data,
     normalize_zip,
     prepare_violations_frame,
+    run_phase2_feature_engineering,
 )
 
 
@@ -129,3 +131,95 @@ def test_property_key_diagnostics_report_case_no_fallback():
 
     assert diagnostics["unique_property_keys"] == 2
     assert diagnostics["case_no_fallback_pct"] > 0
+
+
+def test_build_feature_table_breaks_primary_type_ties_alphabetically():
+    df = pd.DataFrame(
+        {
+            "violation_st": ["1 Comm Ave", "1 Comm Ave", "1 Comm Ave", "1 Comm Ave"],
+            "violation_zip": ["02215", "02215", "02215", "02215"],
+            "violationtype": ["Trash", "Heat", "Heat", "Trash"],
+        }
+    )
+
+    out = build_feature_table(df)
+
+    assert out.iloc[0]["primary_violation_type"] == "Heat"
+
+
+def test_build_feature_table_leaves_primary_type_missing_without_values():
+    df = pd.DataFrame(
+        {
+            "violation_st": ["1 Comm Ave", "1 Comm Ave", "2 Bay State Rd"],
+            "violation_zip": ["02215", "02215", "02215"],
+            "violationtype": ["", None, "Trash"],
+        }
+    )
+
+    out = build_feature_table(df).set_index("property_key")
+
+    assert pd.isna(out.at["1 comm ave|02215", "primary_violation_type"])
+    assert out.at["2 bay state rd|02215", "primary_violation_type"] == "Trash"
+
+
+def test_build_feature_table_from_filtered_slice_keeps_modes_aligned():
+    df = pd.DataFrame(
+        {
+            "case_no": ["A1", "A2", "A3", "A4", "A5"],
+            "violation_st": ["1 Comm Ave", "", "1 Comm Ave", "1 Comm Ave", ""],
+            "violation_zip": ["02215", "", "02215", "02215", ""],
+            "violationtype": ["Trash", "Mold", "Heat", "Heat", "Rodent"],
+        }
+    )
+    prepared, _ = prepare_violations_frame(df)
+    historical = prepared.loc[prepared["case_no"] != "A1"]
+
+    out = build_feature_table_from_prepared(historical, None).set_index("property_key")
+
+    assert out.at["1 comm ave|02215", "property_key_source"] == "address_zip"
+    assert out.at["1 comm ave|02215", "primary_violation_type"] == "Heat"
+    assert out.at["a2", "property_key_source"] == "case_no"
+    assert out.at["a5", "primary_violation_type"] == "Rodent"
+
+
+def test_build_feature_table_normalizes_status_case_and_padding():
+    df = pd.DataFrame(
+        {
+            "violation_st": ["1 Comm Ave", "1 Comm Ave", "1 Comm Ave", "1 Comm Ave", "2 Bay State Rd"],
+            "violation_zip": ["02215", "02215", "02215", "02215", "02215"],
+            "status": [" Open", "CLOSED", "Resolved ", None, "PENDING"],
+        }
+    )
+
+    out = build_feature_table(df).set_index("property_key")
+
+    assert out.at["1 comm ave|02215", "open_violations"] == 1
+    assert out.at["1 comm ave|02215", "closed_violations"] == 2
+    assert out.at["2 bay state rd|02215", "open_violations"] == 1
+    assert out.at["2 bay state rd|02215", "closed_violations"] == 0
+
+
+def test_run_phase2_feature_engineering_reuses_prepared_frame(tmp_path, monkeypatch):
+    df = pd.DataFrame(
+        {
+            "violation_st": ["1 Comm Ave", "1 Comm Ave"],
+            "violation_zip": ["02215", "02215"],
+            "status": ["open", "closed"],
+        }
+    )
+    prepared, date_col = prepare_violations_frame(df)
+
+    def fail(source_df):
+        raise AssertionError("prepared frame should be reused")
+
+    monkeypatch.setattr("src.data.features.prepare_violations_frame", fail)
+
+    output_path = run_phase2_feature_engineering(
+        Phase2FeatureConfig(output_path=tmp_path / "features.csv"),
+        prepared=prepared,
+        date_col=date_col,
+    )
+
+    out = pd.read_csv(output_path)
+    assert out.iloc[0]["total_violations"] == 2
+    assert out.iloc[0]["open_violations"] == 1
@@ -1,6 +1,12 @@
 ﻿import pandas as pd
 
-from src.data.violations import Phase1Config, clean_violations, run_phase1
+from src.data.violations import (
+    Phase1Config,
+    clean_violations,
+    download_violations_csv,
+    read_raw_violations,
+    run_phase1,
+)
 
 
 def test_clean_violations_standardizes_and_derives_flag():
@@ -21,12 +27,14 @@ def test_clean_violations_standardizes_and_derives_flag():
     assert "is_open_violation" in out.columns
     assert len(out) == 2
 
-    open_row = out.loc[out["case_no"] == "A1"].iloc[0]
-    pending_row = out.loc[out["case_no"] == "B2"].iloc[0]
+    by_case = out.set_index("case_no", verify_integrity=True)
 
-    assert open_row["status"] == "open"
-    assert open_row["is_open_violation"] == 1
-    assert pending_row["is_open_violation"] == 1
+    assert by_case.at["A1", "status"] == "open"
+    assert by_case.at["A1", "is_open_violation"] == 1
+    assert by_case.at["B2", "is_open_violation"] == 1
+    assert pd.api.types.is_datetime64_any_dtype(out["violdttm"])
+    assert isinstance(out["status"].dtype, pd.CategoricalDtype)
+    assert pd.isna(by_case.at["B2", "violdttm"])
 
 
 def test_clean_violations_handles_missing_status():
@@ -35,6 +43,54 @@ def test_clean_violations_handles_missing_status():
     assert out.iloc[0]["status"] == "unknown"
 
 
+def test_read_raw_violations_skips_unused_columns(tmp_path):
+    raw_path = tmp_path / "violations.csv"
+    pd.DataFrame(
+        {
+            "Case No": ["A1"],
+            "Status": ["Open"],
+            "Latitude": [42.35],
+            "Code": ["105 CMR"],
+        }
+    ).to_csv(raw_path, index=False)
+    other_path = tmp_path / "other.csv"
+    pd.DataFrame({"Latitude": [42.35], "Code": ["105 CMR"]}).to_csv(other_path, index=False)
+
+    assert list(read_raw_violations(raw_path).columns) == ["Case No", "Status"]
+    assert list(read_raw_violations(other_path).columns) == ["Latitude", "Code"]
+
+
+def test_download_violations_csv_streams_chunks_to_disk(tmp_path, monkeypatch):
+    output_path = tmp_path / "raw" / "violations.csv"
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def raise_for_status(self):
+            return None
+
+        def iter_content(self, chunk_size):
+            assert chunk_size == 4
+            yield b"case_no\n"
+            yield b"A1\n"
+
+    def fake_get(url, timeout, stream):
+        assert stream is True
+        del url, timeout
+        return FakeResponse()
+
+    monkeypatch.setattr("requests.get", fake_get)
+
+    download_violations_csv("https://example.test/violations.csv", output_path, chunk_size=4)
+
+    assert output_path.read_bytes() == b"case_no\nA1\n"
+    assert not (tmp_path / "raw" / "violations.csv.part").exists()
+
+
 def test_run_data_preparation_preloads_optional_phase1_sources(tmp_path, monkeypatch):
     raw_dir = tmp_path / "raw"
     processed_dir = tmp_path / "processed"
@@ -19,6 +19,27 @@ def test_load_boston_zip_boundaries_uses_cached_geojson(tmp_path: Path):
     assert loaded == payload
 
 
+def test_load_boston_zip_boundaries_caches_downloaded_response_body(tmp_path: Path, monkeypatch):
+    cache_path = tmp_path / "raw" / "boston_zip_codes.geojson"
+    body = b'{"type": "FeatureCollection", "features": []}'
+
+    class FakeResponse:
+        content = body
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return json.loads(body)
+
+    monkeypatch.setattr("src.viz.choropleth.requests.get", lambda url, timeout: FakeResponse())
+
+    loaded = load_boston_zip_boundaries(cache_path=cache_path)
+
+    assert loaded == {"type": "FeatureCollection", "features": []}
+    assert cache_path.read_bytes() == body
+
+
 def test_plot_zip_level_choropleth_writes_png_from_cached_geojson(tmp_path: Path):
     cache_path = tmp_path / "boston_zip_codes.geojson"
     cache_path.write_text(